@@ -1,6 +1,10 @@
 import os
+import time
 import jwt
-from datetime import datetime, timedelta
+from argon2 import PasswordHasher
+from cachetools import TTLCache
+from argon2.exceptions import VerifyMismatchError
+from datetime import timedelta
 from typing import Optional
 
 # Simple admin password (in production, use proper user management)
@@ -8,29 +12,65 @@ ADMIN_PASSWORD = "architecture2024"
 SECRET_KEY = os.environ.get("SECRET_KEY", "architectural_portfolio_secret_key_2024")
 ALGORITHM = "HS256"
 
+# Pre-encoded signing key and a reusable PyJWT instance so each encode/decode
+# skips the per-call str->bytes key preparation
+_SECRET_BYTES = SECRET_KEY.encode("utf-8")
+_JWT = jwt.PyJWT()
+
+# Argon2id hasher with the OWASP-recommended 46 MiB / t=1 / p=1 profile,
+# cached at module scope so each login reuses the same instance
+_PASSWORD_HASHER = PasswordHasher(memory_cost=47104, time_cost=1, parallelism=1)
+
+# Prefer a pre-computed hash from the environment; fall back to hashing the
+# default password at startup so the plaintext is never compared directly
+ADMIN_PASSWORD_HASH = os.environ.get("ADMIN_PASSWORD_HASH") or _PASSWORD_HASHER.hash(ADMIN_PASSWORD)
+
 
 def verify_password(password: str) -> bool:
-    """Verify admin password"""
-    return password == ADMIN_PASSWORD
+    """Verify admin password against its Argon2id hash"""
+    try:
+        _PASSWORD_HASHER.verify(ADMIN_PASSWORD_HASH, password)
+        return True
+    except VerifyMismatchError:
+        return False
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = int(time.time()) + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(hours=24)
-    
+        expire = int(time.time()) + 86400  # 24 hours
+
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = _JWT.encode(to_encode, _SECRET_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+# Short-lived cache of decoded payloads keyed by the raw token string, so
+# repeat requests with the same token skip the HMAC + base64 + JSON work
+_token_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
+
 def verify_token(token: str) -> Optional[dict]:
     """Verify JWT token"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    payload = _token_cache.get(token)
+    if payload is not None:
         return payload
+    try:
+        payload = _JWT.decode(
+            token,
+            _SECRET_BYTES,
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "sub"]},
+        )
     except jwt.PyJWTError:
-        return None
\ No newline at end of file
+        return None
+    _token_cache[token] = payload
+    return payload
+
+
+def invalidate_token(token: str) -> None:
+    """Drop a token from the verification cache (e.g. on logout)"""
+    _token_cache.pop(token, None)
\ No newline at end of file
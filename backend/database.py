@@ -1,14 +1,27 @@
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import UpdateOne
+import logging
 import os
+from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection with explicit pool bounds and wire compression;
+# pool sizes are tunable per deployment via env
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=int(os.environ.get('MONGO_POOL_SIZE', 50)),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL', 5)),
+    maxIdleTimeMS=60000,
+    serverSelectionTimeoutMS=3000,
+    compressors="zstd,snappy"
+)
 db: AsyncIOMotorDatabase = client[os.environ.get('DB_NAME', 'architectural_portfolio')]
 
 # Collections
@@ -18,6 +31,7 @@ bio_collection = db.portfolio_bio
 # Sample data for seeding
 SAMPLE_PROJECTS = [
     {
+        "seed_id": "modern-residential-complex",
         "title": "Modern Residential Complex",
         "description": "A contemporary residential development featuring sustainable design principles and innovative use of natural light. The project incorporates locally sourced materials and energy-efficient systems throughout.",
         "year": "2023",
@@ -31,6 +45,7 @@ SAMPLE_PROJECTS = [
         "has_plan_view": True
     },
     {
+        "seed_id": "cultural-arts-center",
         "title": "Cultural Arts Center",
         "description": "A dynamic cultural hub designed to foster community engagement through art and performance. The building features flexible spaces that can adapt to various cultural events and exhibitions.",
         "year": "2022",
@@ -45,6 +60,7 @@ SAMPLE_PROJECTS = [
         "has_plan_view": True
     },
     {
+        "seed_id": "sustainable-office-tower",
         "title": "Sustainable Office Tower",
         "description": "A 20-story office building that achieves LEED Platinum certification through innovative sustainable design strategies including rainwater harvesting, solar panels, and green roof systems.",
         "year": "2023",
@@ -57,6 +73,7 @@ SAMPLE_PROJECTS = [
         "has_plan_view": False
     },
     {
+        "seed_id": "waterfront-pavilion",
         "title": "Waterfront Pavilion",
         "description": "An elegant pavilion structure designed for waterfront events and ceremonies. The design emphasizes transparency and connection with the natural waterfront environment.",
         "year": "2021",
@@ -79,28 +96,45 @@ DEFAULT_BIO = {
 
 
 async def seed_database():
-    """Seed database with sample projects if empty"""
+    """Seed database idempotently; safe to run concurrently across workers"""
     try:
-        # Check if projects already exist
-        project_count = await projects_collection.count_documents({})
-        if project_count == 0:
-            # Insert sample projects
-            await projects_collection.insert_many(SAMPLE_PROJECTS)
-            print(f"✅ Seeded database with {len(SAMPLE_PROJECTS)} projects")
+        # Index the listing order so reads are index-backed and pageable,
+        # plus a unique seed key so re-seeding can never duplicate samples
+        await projects_collection.create_index([("created_at", -1)])
+        await projects_collection.create_index("seed_id", unique=True)
+        await bio_collection.create_index([("updated_at", -1)])
+
+        # Upsert sample projects keyed by seed_id; $setOnInsert leaves any
+        # admin-edited copies untouched and the batch runs unordered.
+        # Timestamps are stamped here because the documents bypass the
+        # Project model (and its defaults) on the way out
+        operations = []
+        for p in SAMPLE_PROJECTS:
+            now = datetime.utcnow()
+            operations.append(UpdateOne(
+                {"seed_id": p["seed_id"]},
+                {"$setOnInsert": {**p, "created_at": now, "updated_at": now}},
+                upsert=True
+            ))
+        result = await projects_collection.bulk_write(operations, ordered=False)
+        if result.upserted_count:
+            logger.info("✅ Seeded database with %d projects", result.upserted_count)
         else:
-            print(f"ℹ️  Database already has {project_count} projects")
-        
-        # Check if bio exists
-        bio_count = await bio_collection.count_documents({})
-        if bio_count == 0:
-            # Insert default bio
-            await bio_collection.insert_one(DEFAULT_BIO)
-            print("✅ Initialized portfolio bio settings")
+            logger.info("ℹ️  Sample projects already seeded")
+
+        # Initialize bio the same way: insert only when missing
+        bio_result = await bio_collection.update_one(
+            {},
+            {"$setOnInsert": {**DEFAULT_BIO, "updated_at": datetime.utcnow()}},
+            upsert=True
+        )
+        if bio_result.upserted_id is not None:
+            logger.info("✅ Initialized portfolio bio settings")
         else:
-            print("ℹ️  Portfolio bio already configured")
-            
+            logger.info("ℹ️  Portfolio bio already configured")
+
     except Exception as e:
-        print(f"❌ Error seeding database: {e}")
+        logger.error("❌ Error seeding database: %s", e)
 
 
 async def close_db_connection():
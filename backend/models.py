@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 
@@ -23,13 +23,12 @@ class ProjectUpdate(ProjectBase):
 
 
 class Project(ProjectBase):
+    model_config = ConfigDict(populate_by_name=True)
+
     id: str = Field(alias="_id")
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        populate_by_name = True
-
 
 class PortfolioBioBase(BaseModel):
     bio_text: str = ""
@@ -41,12 +40,11 @@ class PortfolioBioUpdate(PortfolioBioBase):
 
 
 class PortfolioBio(PortfolioBioBase):
+    model_config = ConfigDict(populate_by_name=True)
+
     id: str = Field(alias="_id")
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        populate_by_name = True
-
 
 class LoginRequest(BaseModel):
     password: str
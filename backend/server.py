@@ -1,18 +1,34 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from starlette.middleware.cors import CORSMiddleware
 from typing import List, Optional
+import asyncio
+import hashlib
 import logging
+import os
+import orjson
+from cachetools import TTLCache
 from datetime import datetime, timedelta
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
 
 # Import our modules
 from models import Project, ProjectCreate, ProjectUpdate, PortfolioBio, PortfolioBioUpdate, LoginRequest, LoginResponse
 from auth import verify_password, create_access_token, verify_token
 from database import db, projects_collection, bio_collection, seed_database, close_db_connection
 
+# Use uvloop when available so Motor/socket awaits run on the libuv loop
+# even for programmatic launches; uvicorn --loop uvloop covers the CLI path
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -20,11 +36,62 @@ api_router = APIRouter(prefix="/api")
 # Security
 security = HTTPBearer()
 
+# Fields the Project model needs; keeps Mongo from decoding anything else
+PROJECT_PROJECTION = {
+    "title": 1,
+    "description": 1,
+    "year": 1,
+    "client": 1,
+    "location": 1,
+    "images": 1,
+    "plan_view": 1,
+    "has_plan_view": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
+# Mongo stores naive UTC datetimes; mark them as UTC when serializing
+ORJSON_OPTS = orjson.OPT_NAIVE_UTC
+
+# Short-lived response caches for the public read endpoints; entries hold
+# wire-ready JSON bytes and are dropped whenever an admin write lands
+_projects_cache: TTLCache = TTLCache(maxsize=32, ttl=30)
+_bio_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+
+
+def _invalidate_projects_cache():
+    _projects_cache.clear()
+
+
+def _invalidate_bio_cache():
+    _bio_cache.clear()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _public_json_response(request: Request, payload: bytes) -> Response:
+    """Wrap a public JSON payload with ETag/Cache-Control, answering
+    conditional requests with an empty 304"""
+    etag = 'W/"' + hashlib.blake2b(payload, digest_size=8).hexdigest() + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(
+        content=payload,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=30"},
+    )
+
+
+def _to_oid(project_id: str) -> ObjectId:
+    """Parse a project id in one pass, mapping bad input to a 400"""
+    try:
+        return ObjectId(project_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid project ID")
+
+
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Dependency to get current authenticated user"""
     token = credentials.credentials
@@ -40,35 +107,51 @@ async def root():
     return {"message": "Architectural Portfolio API"}
 
 
-@api_router.get("/projects", response_model=List[Project])
-async def get_projects():
+@api_router.get("/projects", responses={200: {"model": List[Project]}})
+async def get_projects(request: Request, skip: int = 0, limit: int = 50):
     """Get all projects for public portfolio view"""
     try:
-        projects_cursor = projects_collection.find({})
-        projects = await projects_cursor.to_list(length=100)
-        
-        # Convert ObjectId to string for each project
-        for project in projects:
+        cached = _projects_cache.get((skip, limit))
+        if cached is not None:
+            return _public_json_response(request, cached)
+
+        cursor = (
+            projects_collection.find({}, PROJECT_PROJECTION)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit)
+        )
+        projects = []
+        async for project in cursor:
             project["_id"] = str(project["_id"])
-            
-        return projects
+            projects.append(project)
+
+        payload = orjson.dumps(projects, option=ORJSON_OPTS)
+        _projects_cache[(skip, limit)] = payload
+        return _public_json_response(request, payload)
     except Exception as e:
         logger.error(f"Error fetching projects: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @api_router.get("/portfolio-bio", response_model=PortfolioBio)
-async def get_portfolio_bio():
+async def get_portfolio_bio(request: Request):
     """Get portfolio bio/description for public view"""
     try:
+        cached = _bio_cache.get("bio")
+        if cached is not None:
+            return _public_json_response(request, cached)
+
         bio = await bio_collection.find_one({})
         if bio:
             bio["_id"] = str(bio["_id"])
-            return bio
         else:
             # Return default if none exists
-            default_bio = {"_id": "default", "bio_text": "", "bio_enabled": False, "updated_at": datetime.utcnow()}
-            return default_bio
+            bio = {"_id": "default", "bio_text": "", "bio_enabled": False, "updated_at": datetime.utcnow()}
+
+        payload = orjson.dumps(bio, option=ORJSON_OPTS)
+        _bio_cache["bio"] = payload
+        return _public_json_response(request, payload)
     except Exception as e:
         logger.error(f"Error fetching bio: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -108,18 +191,19 @@ async def create_project(
     """Create a new project (admin only)"""
     try:
         # Add timestamps
-        project_dict = project_data.dict()
+        project_dict = project_data.model_dump()
         project_dict["created_at"] = datetime.utcnow()
         project_dict["updated_at"] = datetime.utcnow()
         
-        # Insert into database
+        # Insert into database and build the response from what we wrote,
+        # skipping the read-back round trip
         result = await projects_collection.insert_one(project_dict)
-        
-        # Fetch the created project
-        created_project = await projects_collection.find_one({"_id": result.inserted_id})
-        created_project["_id"] = str(created_project["_id"])
-        
-        return created_project
+        project_dict["_id"] = str(result.inserted_id)
+
+        _invalidate_projects_cache()
+
+        # The document is schema-clean by construction; skip re-validation
+        return ORJSONResponse(project_dict)
     except Exception as e:
         logger.error(f"Error creating project: {e}")
         raise HTTPException(status_code=500, detail="Failed to create project")
@@ -133,28 +217,29 @@ async def update_project(
 ):
     """Update a project (admin only)"""
     try:
-        # Validate ObjectId
-        if not ObjectId.is_valid(project_id):
-            raise HTTPException(status_code=400, detail="Invalid project ID")
-        
+        oid = _to_oid(project_id)
+
         # Update data
-        update_dict = project_data.dict()
+        update_dict = project_data.model_dump()
         update_dict["updated_at"] = datetime.utcnow()
         
-        # Update in database
-        result = await projects_collection.update_one(
-            {"_id": ObjectId(project_id)},
-            {"$set": update_dict}
+        # Update and fetch the result in one round trip
+        updated_project = await projects_collection.find_one_and_update(
+            {"_id": oid},
+            {"$set": update_dict},
+            return_document=ReturnDocument.AFTER,
+            projection=PROJECT_PROJECTION
         )
-        
-        if result.matched_count == 0:
+
+        if updated_project is None:
             raise HTTPException(status_code=404, detail="Project not found")
-        
-        # Fetch updated project
-        updated_project = await projects_collection.find_one({"_id": ObjectId(project_id)})
+
         updated_project["_id"] = str(updated_project["_id"])
-        
-        return updated_project
+
+        _invalidate_projects_cache()
+
+        # Trusted Mongo document; skip outbound re-validation
+        return ORJSONResponse(updated_project)
     except HTTPException:
         raise
     except Exception as e:
@@ -169,16 +254,16 @@ async def delete_project(
 ):
     """Delete a project (admin only)"""
     try:
-        # Validate ObjectId
-        if not ObjectId.is_valid(project_id):
-            raise HTTPException(status_code=400, detail="Invalid project ID")
-        
+        oid = _to_oid(project_id)
+
         # Delete from database
-        result = await projects_collection.delete_one({"_id": ObjectId(project_id)})
+        result = await projects_collection.delete_one({"_id": oid})
         
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Project not found")
-        
+
+        _invalidate_projects_cache()
+
         return {"message": "Project deleted successfully"}
     except HTTPException:
         raise
@@ -195,24 +280,26 @@ async def update_portfolio_bio(
     """Update portfolio bio/description (admin only)"""
     try:
         # Update data
-        update_dict = bio_data.dict()
+        update_dict = bio_data.model_dump()
         update_dict["updated_at"] = datetime.utcnow()
         
-        # Update or insert bio
-        result = await bio_collection.update_one(
+        # Update or insert bio and fetch the result in one round trip
+        updated_bio = await bio_collection.find_one_and_update(
             {},  # Update any existing bio
             {"$set": update_dict},
-            upsert=True
+            upsert=True,
+            return_document=ReturnDocument.AFTER
         )
-        
-        # Fetch updated bio
-        updated_bio = await bio_collection.find_one({})
+
         if updated_bio:
             updated_bio["_id"] = str(updated_bio["_id"])
-            return updated_bio
+            _invalidate_bio_cache()
+            # Trusted Mongo document; skip outbound re-validation
+            return ORJSONResponse(updated_bio)
         else:
             raise HTTPException(status_code=500, detail="Failed to update bio")
-            
+
+
     except Exception as e:
         logger.error(f"Error updating bio: {e}")
         raise HTTPException(status_code=500, detail="Failed to update bio")
@@ -221,20 +308,27 @@ async def update_portfolio_bio(
 # Include the router in the main app
 app.include_router(api_router)
 
-# CORS middleware
+# CORS middleware pinned to named origins; wildcard origins are invalid
+# alongside credentials and force slow-path header reconciliation
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.environ.get("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=CORS_ORIGINS,
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 
 @app.on_event("startup")
 async def startup_db():
-    """Initialize database on startup"""
-    await seed_database()
+    """Initialize database on startup without blocking request serving"""
+    asyncio.create_task(seed_database())
 
 
 @app.on_event("shutdown")